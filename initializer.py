@@ -1,9 +1,9 @@
 # initializer.py
 import os
-import pandas as pd
-from datetime import datetime
-from util.password import Password
-from util.input_validator import InputValidator
+import csv
+from datetime import date
+from util.password import PASSWORD_HANDLER
+from util.input_validator import VALIDATOR
 
 # File and directory setup
 DATA_DIR = "data"
@@ -13,6 +13,11 @@ LOG_DIR = os.path.join(DATA_DIR, "logs")
 PRODUCT_FILE = os.path.join(DATA_FILES_DIR, "products.csv")
 EMPLOYEE_FILE = os.path.join(DATA_FILES_DIR, "employees.csv")
 
+EMPLOYEE_COLUMNS = [
+    "eid", "first_name", "last_name", "starting_date", "is_active",
+    "etype", "eemail", "ephone", "fav_food", "password"
+]
+
 LOG_FILES = {
     "sign_in_log": ["eid", "action", "timestamp"],
     "profile_activity_log": ["eid", "action", "timestamp"],
@@ -27,11 +32,25 @@ LOG_FILES = {
 }
 
 # Helper Functions
-def create_empty_csv(file_path, columns):
-    """Creates an empty CSV file with specified columns."""
+def list_existing_files(directory):
+    """Returns the names of the files in a directory, collected in a single directory scan."""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+def create_empty_csv(file_path, columns, existing_files=None):
+    """
+    Creates an empty CSV file with specified columns.
+
+    If existing_files (a set from list_existing_files) is given, it is used instead of checking the path on disk.
+    """
     try:
-        if not os.path.exists(file_path):
-            pd.DataFrame(columns=columns).to_csv(file_path, index=False)
+        if existing_files is None:
+            exists = os.path.exists(file_path)
+        else:
+            exists = os.path.basename(file_path) in existing_files
+        if not exists:
+            with open(file_path, "w", newline="") as file:
+                csv.writer(file).writerow(columns)
             print(f"Created file: {file_path}")
         else:
             print(f"File already exists: {file_path}")
@@ -51,9 +70,10 @@ def setup_directories():
 def initialize_logs():
     """Creates all required log files."""
     try:
+        existing_files = list_existing_files(LOG_DIR)
         for log_name, columns in LOG_FILES.items():
             file_path = os.path.join(LOG_DIR, f"{log_name}.csv")
-            create_empty_csv(file_path, columns)
+            create_empty_csv(file_path, columns, existing_files)
     except Exception as e:
         print(f"Error initializing logs: {e}")
         raise
@@ -61,14 +81,11 @@ def initialize_logs():
 def initialize_data_files():
     """Initializes the product and employee files."""
     try:
+        existing_files = list_existing_files(DATA_FILES_DIR)
         product_columns = ["pid", "is_active", "inventory", "pname", "pdescription", "pprice", "added_date", "ptags"]
-        create_empty_csv(PRODUCT_FILE, product_columns)
+        create_empty_csv(PRODUCT_FILE, product_columns, existing_files)
         
-        employee_columns = [
-            "eid", "first_name", "last_name", "starting_date", "is_active",
-            "etype", "eemail", "ephone", "fav_food", "password"
-        ]
-        create_empty_csv(EMPLOYEE_FILE, employee_columns)
+        create_empty_csv(EMPLOYEE_FILE, EMPLOYEE_COLUMNS, existing_files)
     except Exception as e:
         print(f"Error initializing data files: {e}")
         raise
@@ -77,42 +94,43 @@ def add_admin():
     """Prompts for admin details and adds the admin to the employee file."""
     print("Admin Initialization")
     try:
-        password_handler = Password()
-        input_handler = InputValidator()
-
         # Collect admin details using InputValidator
-        first_name = input_handler.get_string_input(prompt="Enter Admin First Name: ", min_length=3)
-        last_name = input_handler.get_string_input(prompt="Enter Admin Last Name: ", min_length=3)
-        email = input_handler.get_email_input(prompt="Enter Admin Email: ")
-        phone = input_handler.get_phone_input(prompt="Enter Admin Phone: ")
-        fav_food = input_handler.get_string_input(prompt="Enter Admin Favorite Food: ", min_length=3)
+        first_name = VALIDATOR.get_string_input(prompt="Enter Admin First Name: ", min_length=3)
+        last_name = VALIDATOR.get_string_input(prompt="Enter Admin Last Name: ", min_length=3)
+        email = VALIDATOR.get_email_input(prompt="Enter Admin Email: ")
+        phone = VALIDATOR.get_phone_input(prompt="Enter Admin Phone: ")
+        fav_food = VALIDATOR.get_string_input(prompt="Enter Admin Favorite Food: ", min_length=3)
 
         # Get secure password input with validation
-        password = input_handler.get_password_input(prompt="Enter Admin Password: ", min_length=8, max_length=20)
+        password = VALIDATOR.get_password_input(prompt="Enter Admin Password: ", min_length=8, max_length=20)
 
         # Hash the password using Password class
-        hashed_password = password_handler.hash_password(password)
+        hashed_password = PASSWORD_HANDLER.hash_password(password)
 
-        admin_data = pd.DataFrame([{
+        admin_data = {
             "eid": 0,
             "first_name": first_name,
             "last_name": last_name,
-            "starting_date": datetime.now().strftime("%Y-%m-%d"),
+            "starting_date": date.today().isoformat(),
             "is_active": True,
             "etype": 0,
             "eemail": email,
             "ephone": phone,
             "fav_food": fav_food,
             "password": hashed_password
-        }])
+        }
 
-        if os.path.exists(EMPLOYEE_FILE):
-            existing_data = pd.read_csv(EMPLOYEE_FILE)
-            combined_data = pd.concat([existing_data, admin_data], ignore_index=True)
-            combined_data.to_csv(EMPLOYEE_FILE, index=False)
+        # Append only the new row; the header is written only if the file is new or empty
+        file_exists = os.path.exists(EMPLOYEE_FILE)
+        write_header = not file_exists or os.path.getsize(EMPLOYEE_FILE) == 0
+        with open(EMPLOYEE_FILE, "a", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=EMPLOYEE_COLUMNS)
+            if write_header:
+                writer.writeheader()
+            writer.writerow(admin_data)
+        if file_exists:
             print("Admin added to existing employee file.")
         else:
-            admin_data.to_csv(EMPLOYEE_FILE, index=False)
             print("Admin added and employee file created.")
     except Exception as e:
         print(f"Error adding admin: {e}")
@@ -1,7 +1,31 @@
 import csv
-from datetime import datetime
-from util.ui import TerminalToolkit
-from util.input_validator import InputValidator
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from datetime import date
+from util.ux_enhancements import TerminalToolkit
+from util.input_validator import VALIDATOR
+
+# Today's date and its formatted string, cached so bulk creation formats the date once per day
+_cached_date = None
+_cached_date_str = None
+
+
+def _today_str():
+    """
+    Returns today's date as a YYYY-MM-DD string, reformatting it only when the date changes.
+
+    Returns:
+    - str: Today's date.
+    """
+    global _cached_date, _cached_date_str
+    current = date.today()
+    if current != _cached_date:
+        _cached_date = current
+        _cached_date_str = current.isoformat()
+    return _cached_date_str
+
 
 class Product:
     """
@@ -18,6 +42,20 @@ class Product:
     product_file = "data/products.csv"
     product_columns = ["pid", "is_active", "inventory", "pname", "pdescription", "pprice", "added_date", "ptags"]
 
+    # The product file's bookkeeping below is always read and set on Product itself, so subclasses writing to the
+    # same file share one pid counter, header flag and offset index.
+    # Maps pid -> byte offset of its record in the product file. Built lazily by _build_index on the first
+    # lookup, update or pid generation, then kept current by every write.
+    _offsets = None
+    # Next pid to hand out. Counted from the product file once, then advanced in memory on every write.
+    _next_pid = None
+    # Whether the product file already has its header row. Checked on the first write only.
+    _header_written = None
+
+    # Per-instance write batching state (see batch()). Class-level defaults also cover objects from from_existing.
+    _batching = False
+    _dirty = False
+
     def __init__(self, pname, pdescription, inventory, pprice, ptags):
         """
         Constructor for the Product class.
@@ -37,7 +75,7 @@ class Product:
         self.pname = pname
         self.pdescription = pdescription
         self.pprice = pprice
-        self.added_date = datetime.now().strftime("%Y-%m-%d")
+        self.added_date = _today_str()
         self.ptags = ptags
         self._write_to_file()
 
@@ -73,44 +111,189 @@ class Product:
     @classmethod
     def _generate_pid(cls):
         """
-        Generates a new unique product ID based on the number of records in the product file.
+        Generates a new unique product ID, one past the highest pid in the product file.
+
+        The highest pid is taken from the pid -> offset index on the first call, so the product file is scanned
+        at most once for both; afterwards the cached counter is used.
 
         Returns:
         - int: A unique product ID.
         """
-        try:
-            with open(cls.product_file, "r") as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header row
-                pid = sum(1 for _ in reader) + 1
-        except FileNotFoundError:
-            pid = 1
-        return pid
+        if Product._next_pid is None:
+            try:
+                Product._next_pid = max(cls._get_index(), default=0) + 1
+            except FileNotFoundError:
+                Product._next_pid = 1
+        return Product._next_pid
 
     def _write_to_file(self):
         """
         Writes the current product's data to the product file.
 
+        Handles exceptions related to file permissions and general errors. If an exception occurs, an appropriate
+        error message is printed to assist with debugging.
+        """
+        self._write_products([self])
+
+    @classmethod
+    def _write_products(cls, products):
+        """
+        Appends the records of the given products to the product file with a single write call.
+
+        Parameters:
+        - products (list): Product objects to write, in pid order.
+
+        Returns:
+        - bool: True if the records were written, False if an error occurred.
+
         Handles exceptions related to file permissions and general errors. If an exception occurs, an appropriate
         error message is printed to assist with debugging.
         """
         try:
+            chunks = []
             # Check if file exists and write header if needed
-            write_header = not self._file_exists()
-            with open(self.product_file, "a", newline="") as file:
-                writer = csv.writer(file)
-                if write_header:
-                    writer.writerow(self.product_columns)
-                writer.writerow([
-                    self.pid, self.is_active, self.inventory, self.pname,
-                    self.pdescription, self.pprice, self.added_date, self.ptags
-                ])
+            if Product._header_written is None:
+                Product._header_written = cls._file_exists() and os.path.getsize(cls.product_file) > 0
+            if not Product._header_written:
+                chunks.append(cls._encode_row(cls.product_columns))
+
+            with open(cls.product_file, "ab") as file:
+                offset = file.tell() + sum(len(chunk) for chunk in chunks)
+                offsets = {}
+                for product in products:
+                    row = cls._encode_row(product._as_row())
+                    offsets[product.pid] = offset
+                    offset += len(row)
+                    chunks.append(row)
+                file.write(b"".join(chunks))
+
+            Product._header_written = True
+            if Product._offsets is not None:
+                Product._offsets.update(offsets)
+            Product._next_pid = products[-1].pid + 1
+            return True
         except PermissionError:
             print("Error: Insufficient permissions to write to the product file.")
         except IOError as e:
             print(f"Error: I/O error occurred while writing to the file: {e}")
         except Exception as e:
             print(f"Unexpected error: {e}")
+        return False
+
+    @classmethod
+    def create_products(cls, products):
+        """
+        Creates several new products at once, e.g. for a bulk import.
+
+        All records are appended to the product file with a single write instead of one write per product.
+
+        Parameters:
+        - products (list): Tuples of (pname, pdescription, inventory, pprice, ptags), as taken by the constructor.
+
+        Returns:
+        - list: The new Product objects, or an empty list if nothing could be written.
+        """
+        if not products:
+            return []
+        first_pid = cls._generate_pid()
+        added_date = _today_str()
+        created = [
+            cls.from_existing(first_pid + i, True, inventory, pname, pdescription, pprice, added_date, ptags)
+            for i, (pname, pdescription, inventory, pprice, ptags) in enumerate(products)
+        ]
+        if cls._write_products(created):
+            return created
+        return []
+
+    def _as_row(self):
+        """
+        Returns the product's data as a list ordered like product_columns.
+
+        is_active is stored as 1/0 rather than True/False, so the record keeps its width when a product is
+        activated or deactivated and _update_file can always patch it in place.
+
+        Returns:
+        - list: The product record.
+        """
+        return [
+            self.pid, int(self.is_active), self.inventory, self.pname,
+            self.pdescription, self.pprice, self.added_date, self.ptags
+        ]
+
+    @staticmethod
+    def _encode_row(row):
+        """
+        Serializes a single record exactly as csv.writer would write it to the product file.
+
+        Parameters:
+        - row (list): The values to serialize.
+
+        Returns:
+        - bytes: The encoded CSV line, including its line terminator.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(row)
+        return buffer.getvalue().encode("utf-8")
+
+    @staticmethod
+    def _read_record(readline):
+        """
+        Reads one CSV record from a binary file. A record spans several physical lines when a quoted field
+        contains a line break, so lines are joined until every quoted field is closed.
+
+        Parameters:
+        - readline (callable): The readline method of the file (or memory map) positioned at the record.
+
+        Returns:
+        - bytes: The raw record including its line terminator, or b"" at end of file.
+        """
+        record = readline()
+        # csv.writer doubles quotes inside quoted fields, so an odd count means a quoted field is still open
+        while record.count(b'"') % 2:
+            line = readline()
+            if not line:
+                break
+            record += line
+        return record
+
+    @classmethod
+    def _build_index(cls):
+        """
+        Scans the product file once and records the byte offset at which each product's record starts.
+
+        Returns:
+        - dict: Mapping of pid to byte offset.
+
+        Raises:
+        - FileNotFoundError: If the product file does not exist.
+        """
+        offsets = {}
+        with open(cls.product_file, "rb") as file:
+            # The file is mapped rather than read, so lines are sliced straight from the page cache
+            if os.fstat(file.fileno()).st_size > 0:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    offset = len(cls._read_record(mapped.readline))  # Skip header row
+                    for record in iter(lambda: cls._read_record(mapped.readline), b""):
+                        pid = record.split(b",", 1)[0].strip()
+                        # Blank lines (e.g. a stray trailing line break) and rows without a numeric pid are
+                        # not product records, so they are skipped rather than aborting the scan
+                        if pid.isdigit():
+                            offsets[int(pid)] = offset
+                        offset += len(record)
+        Product._offsets = offsets
+        return offsets
+
+    @classmethod
+    def _get_index(cls):
+        """
+        Returns the pid -> offset index, building it on first use.
+
+        Returns:
+        - dict: Mapping of pid to byte offset.
+        """
+        if Product._offsets is None:
+            return cls._build_index()
+        return Product._offsets
 
     @staticmethod
     def _file_exists():
@@ -120,11 +303,7 @@ class Product:
         Returns:
         - bool: True if the file exists, False otherwise.
         """
-        try:
-            with open(Product.product_file, "r"):
-                return True
-        except FileNotFoundError:
-            return False
+        return os.path.isfile(Product.product_file)
 
     # Getters
     def get_pid(self):
@@ -208,7 +387,7 @@ class Product:
         - is_active (bool): True to activate, False to deactivate.
         """
         self.is_active = is_active
-        self._update_file()
+        self._save()
 
     def set_pname(self, pname):
         """
@@ -218,7 +397,7 @@ class Product:
         - pname (str): New product name.
         """
         self.pname = pname
-        self._update_file()
+        self._save()
 
     def set_pdescription(self, pdescription):
         """
@@ -228,7 +407,7 @@ class Product:
         - pdescription (str): New product description.
         """
         self.pdescription = pdescription
-        self._update_file()
+        self._save()
 
     def set_pprice(self, pprice):
         """
@@ -238,7 +417,7 @@ class Product:
         - pprice (float): New product price.
         """
         self.pprice = pprice
-        self._update_file()
+        self._save()
 
     def set_ptags(self, ptags):
         """
@@ -248,7 +427,7 @@ class Product:
         - ptags (str): New product tags, separated by '|'.
         """
         self.ptags = ptags
-        self._update_file()
+        self._save()
 
     # Inventory management
     def add_inventory(self, num):
@@ -260,7 +439,7 @@ class Product:
         """
         if num > 0:
             self.inventory += num
-            self._update_file()
+            self._save()
         else:
             print("Error: Cannot add non-positive inventory.")
 
@@ -273,36 +452,90 @@ class Product:
         """
         if num > 0 and num <= self.inventory:
             self.inventory -= num
-            self._update_file()
+            self._save()
         else:
             print("Error: Invalid inventory removal amount.")
 
+    def _save(self):
+        """
+        Persists a change to the product: immediately, or once at the end of the enclosing batch() block.
+        """
+        if self._batching:
+            self._dirty = True
+        else:
+            self._update_file()
+
+    def flush(self):
+        """
+        Writes any changes deferred by batch() to the product file.
+        """
+        if self._dirty:
+            self._dirty = False
+            self._update_file()
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups several changes into a single write of the product record.
+
+        Setters and inventory changes made inside the block only update the object; the record is written once
+        when the outermost block exits.
+
+        Example:
+        - with product.batch():
+              product.set_pprice(9.99)
+              product.set_ptags("sale|new")
+              product.add_inventory(10)
+
+        Yields:
+        - Product: This product.
+        """
+        previous = self._batching
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = previous
+            if not previous:
+                self.flush()
+
     def _update_file(self):
         """
         Updates the product record in the product file.
 
+        The record is located through the pid -> offset index and patched in place. If the new record has a
+        different width, only the records that follow it are rewritten.
+
         Handles exceptions related to file read/write operations. Ensures robust error messages for debugging.
         """
         try:
-            rows = []
-            with open(self.product_file, "r") as file:
-                reader = csv.reader(file)
-                rows = list(reader)
-
-            # Find and update the row matching this pid
-            for row in rows:
-                if row[0] == str(self.pid):
-                    row[1] = self.is_active
-                    row[2] = self.inventory
-                    row[3] = self.pname
-                    row[4] = self.pdescription
-                    row[5] = self.pprice
-                    row[7] = self.ptags
-                    break
-
-            with open(self.product_file, "w", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerows(rows)
+            offsets = self._get_index()
+            if self.pid not in offsets:
+                print(f"Error: Product with ID {self.pid} not found.")
+                return
+            offset = offsets[self.pid]
+
+            with open(self.product_file, "r+b") as file:
+                file.seek(offset)
+                old_row = self._read_record(file.readline)
+                new_row = self._encode_row(self._as_row())
+
+                if len(new_row) == len(old_row):
+                    # Same width: overwrite the record in place
+                    file.seek(offset)
+                    file.write(new_row)
+                else:
+                    # Width changed: only the records after this one need to move
+                    tail = file.read()
+                    file.seek(offset)
+                    file.write(new_row)
+                    file.write(tail)
+                    file.truncate()
+
+                    shift = len(new_row) - len(old_row)
+                    for pid, position in offsets.items():
+                        if position > offset:
+                            offsets[pid] = position + shift
 
         except FileNotFoundError:
             print("Error: Product file not found.")
@@ -320,16 +553,15 @@ class Product:
         - Product: A new Product object initialized with user-provided data.
         """
         toolkit = TerminalToolkit()
-        validator = InputValidator()
 
-        pname = validator.get_string_input("Enter product name: ", min_length=3, max_length=50)
-        pdescription = validator.get_string_input("Enter product description: ", min_length=3, max_length=200)
-        inventory = validator.get_int_input("Enter inventory count: ", min_val=0)
-        pprice = validator.get_float_input("Enter product price: ", min_val=0.01)
+        pname = VALIDATOR.get_string_input("Enter product name: ", min_length=3, max_length=50)
+        pdescription = VALIDATOR.get_string_input("Enter product description: ", min_length=3, max_length=200)
+        inventory = VALIDATOR.get_int_input("Enter inventory count: ", min_val=0)
+        pprice = VALIDATOR.get_float_input("Enter product price: ", min_val=0.01)
         ptags = ""
 
         while True:
-            ptags = validator.get_string_input("Enter product tags (separated by '|'): ")
+            ptags = VALIDATOR.get_string_input("Enter product tags (separated by '|'): ")
             if all(tag.strip() for tag in ptags.split("|")):
                 break
             toolkit.draw_box("Invalid format for tags. Please use 'tag1|tag2|tag3'.", color="red")
@@ -341,6 +573,8 @@ class Product:
         """
         Retrieves a product by its ID and returns it as a Product object.
 
+        The record is read directly at its offset in the product file instead of scanning every row.
+
         Parameters:
         - pid (int): The ID of the product to retrieve.
 
@@ -352,20 +586,22 @@ class Product:
         - Logs an error message if the product file is missing or another issue occurs.
         """
         try:
-            with open(cls.product_file, "r") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if int(row["pid"]) == pid:
-                        return cls.from_existing(
-                            pid=int(row["pid"]),
-                            is_active=row["is_active"] == "True",
-                            inventory=int(row["inventory"]),
-                            pname=row["pname"],
-                            pdescription=row["pdescription"],
-                            pprice=float(row["pprice"]),
-                            added_date=row["added_date"],
-                            ptags=row["ptags"]
-                        )
+            offsets = cls._get_index()
+            if pid in offsets:
+                with open(cls.product_file, "rb") as file:
+                    file.seek(offsets[pid])
+                    line = cls._read_record(file.readline).decode("utf-8")
+                row_pid, is_active, inventory, pname, pdescription, pprice, added_date, ptags = next(csv.reader([line]))
+                return cls.from_existing(
+                    pid=int(row_pid),
+                    is_active=is_active in ("1", "True"),  # "True" is written by older versions
+                    inventory=int(inventory),
+                    pname=pname,
+                    pdescription=pdescription,
+                    pprice=float(pprice),
+                    added_date=added_date,
+                    ptags=ptags
+                )
             print(f"Error: Product with ID {pid} not found.")
         except FileNotFoundError:
             print("Error: Product file not found.")
@@ -0,0 +1,70 @@
+import csv
+
+import pytest
+
+from product.product import Product
+
+
+@pytest.fixture
+def product_file(tmp_path, monkeypatch):
+    """Points Product at an empty file in a temporary directory and resets its class-level caches."""
+    path = tmp_path / "products.csv"
+    monkeypatch.setattr(Product, "product_file", str(path))
+    monkeypatch.setattr(Product, "_offsets", None)
+    monkeypatch.setattr(Product, "_next_pid", None)
+    monkeypatch.setattr(Product, "_header_written", None)
+    return path
+
+
+def read_rows(path):
+    with open(path, newline="") as file:
+        return list(csv.reader(file))
+
+
+def test_update_keeps_multiline_records_intact(product_file):
+    widget, gadget = Product.create_products([
+        ("Widget", "line one\nline two", 9, 1.5, "a|b"),
+        ("Gadget", "plain", 3, 2.0, "c"),
+    ])
+
+    widget.add_inventory(1)     # width changes: record and tail are rewritten
+    widget.set_pprice(2.5)      # same width: record is patched in place
+    gadget.set_pdescription('quoted "text"\r\nover lines')
+
+    rows = read_rows(product_file)
+    assert [row[0] for row in rows] == ["pid", "1", "2"]
+    assert rows[1][2:6] == ["10", "Widget", "line one\nline two", "2.5"]
+    assert rows[2][4] == 'quoted "text"\r\nover lines'
+
+    # A fresh index built from the file must find the same records
+    Product._offsets = None
+    assert vars(Product.get_product(widget.pid)) == vars(widget)
+    assert vars(Product.get_product(gadget.pid)) == vars(gadget)
+
+
+def test_index_skips_blank_and_malformed_lines(product_file):
+    Product.create_products([("Widget", "plain", 1, 1.0, "a"), ("Gadget", "plain", 2, 2.0, "b")])
+    with open(product_file, "ab") as file:
+        file.write(b"\r\nnot,a,record\r\n\r\n")
+
+    Product._offsets = None
+    Product._next_pid = None
+    assert Product.get_product(2).pname == "Gadget"
+
+    product = Product("Gizmo", "plain", 3, 3.0, "c")
+    assert product.pid == 3
+    assert Product.get_product(3).pname == "Gizmo"
+
+
+def test_subclasses_share_the_pid_counter(product_file):
+    class Perishable(Product):
+        pass
+
+    first = Perishable("Milk", "plain", 1, 1.0, "dairy")
+    second = Perishable("Eggs", "plain", 2, 2.0, "dairy")
+    third = Product("Salt", "plain", 3, 3.0, "pantry")
+    assert [first.pid, second.pid, third.pid] == [1, 2, 3]
+
+    Product._offsets = None
+    assert [row[0] for row in read_rows(product_file)] == ["pid", "1", "2", "3"]
+    assert Perishable.get_product(2).pname == "Eggs"
@@ -1,6 +1,100 @@
-import re
+import string
 import getpass
-from util.password import Password
+from functools import lru_cache
+from util.password import PASSWORD_HANDLER
+
+# Characters allowed in the local part and the domain of an email address
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+
+# Well-formed but obviously fake mobile numbers (sequential digit runs) that are rejected as placeholders.
+# Numbers made of a single repeated digit, such as 9999999999, are rejected separately.
+_PHONE_PLACEHOLDERS = frozenset({"6789012345", "7890123456", "8901234567", "9012345678", "9876543210"})
+
+# Validation results are memoized: bulk imports and repeated prompts often check the same values again.
+@lru_cache(maxsize=4096)
+def _check_email(email):
+    """Returns True if the email address is valid. See InputValidator.is_valid_email."""
+    if not 6 <= len(email) <= 256:
+        return False
+    local, at, domain = email.partition("@")
+    if not at or not 1 <= len(local) <= 64 or len(domain) > 255:
+        return False
+
+    # The top-level domain follows the last dot and must be at least two letters
+    dot = domain.rfind(".")
+    tld = domain[dot + 1:]
+    return (
+        dot > 0 and len(tld) >= 2 and tld.isascii() and tld.isalpha()
+        and _EMAIL_LOCAL_CHARS.issuperset(local)
+        and _EMAIL_DOMAIN_CHARS.issuperset(domain[:dot])
+    )
+
+@lru_cache(maxsize=4096)
+def _check_phone(phone):
+    """Returns True if the phone number is valid. See InputValidator.is_valid_phone."""
+    # Optional "+91" country code, optionally followed by a dash or a space
+    number = phone
+    if number.startswith("+91"):
+        number = number[3:]
+        if number[:1] == "-" or number[:1].isspace():
+            number = number[1:]
+    if not (len(number) == 10 and number[0] in "6789" and number.isdecimal()):
+        return False
+    return number not in _PHONE_PLACEHOLDERS and number.count(number[0]) != 10
+
+def _parse_int(text):
+    """
+    Returns int(text), or None if text is not an integer.
+
+    Plain digit strings are recognized up front, so the common valid and invalid inputs never raise ValueError.
+    Only inputs that might use int()'s rarer syntax (digit-group underscores) fall back to try/except. Values
+    that are not strings, e.g. numbers passed in directly, are handed to int() as they are.
+    """
+    if not isinstance(text, str):
+        try:
+            return int(text)
+        except (ValueError, TypeError):
+            return None
+    digits = text.strip()
+    if digits[:1] in ("+", "-"):
+        digits = digits[1:]
+    if digits.isdecimal():
+        return int(text)
+    if "_" not in digits:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+# Non-numeric spellings accepted by float(), compared case-insensitively after the sign
+_FLOAT_WORDS = frozenset({"inf", "infinity", "nan"})
+
+def _parse_float(text):
+    """
+    Returns float(text), or None if text is not a number.
+
+    Plain decimals are recognized up front and text without any digit is rejected up front, so the common inputs
+    never raise ValueError. Exponents, underscores and other float() syntax fall back to try/except. Values that
+    are not strings, e.g. numbers passed in directly, are handed to float() as they are.
+    """
+    if not isinstance(text, str):
+        try:
+            return float(text)
+        except (ValueError, TypeError):
+            return None
+    unsigned = text.strip()
+    if unsigned[:1] in ("+", "-"):
+        unsigned = unsigned[1:]
+    if unsigned.replace(".", "", 1).isdecimal():
+        return float(text)
+    if unsigned.lower() not in _FLOAT_WORDS and not any(char.isdecimal() for char in unsigned):
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
 
 class InputValidator:
     """
@@ -10,13 +104,11 @@ class InputValidator:
     validate specific formats like email or phone numbers, and handle password inputs securely.
     """
 
-    def __init__(self):
-        """
-        Initializes an instance of the InputValidator class. Currently, no instance-specific attributes are defined.
-        """
-        pass
+    # All methods are static; instances carry no attributes, so they need no per-instance __dict__
+    __slots__ = ()
 
-    def is_valid_string(self, input_string, min_length=None, max_length=None):
+    @staticmethod
+    def is_valid_string(input_string, min_length=None, max_length=None):
         """
         Validates if a string meets the specified length constraints.
 
@@ -36,7 +128,8 @@ class InputValidator:
             return False
         return True
 
-    def is_valid_int(self, input_value, min_val=None, max_val=None):
+    @staticmethod
+    def is_valid_int(input_value, min_val=None, max_val=None):
         """
         Validates if a value is an integer within the specified range.
 
@@ -48,20 +141,20 @@ class InputValidator:
         Returns:
         - bool: True if the value is a valid integer and within range, False otherwise.
         """
-        try:
-            int_value = int(input_value)
-            if min_val is not None and int_value < min_val:
-                print(f"Value must be at least {min_val}.")
-                return False
-            if max_val is not None and int_value > max_val:
-                print(f"Value must be no more than {max_val}.")
-                return False
-            return True
-        except ValueError:
+        int_value = _parse_int(input_value)
+        if int_value is None:
             print("Invalid input. Please enter an integer.")
             return False
+        if min_val is not None and int_value < min_val:
+            print(f"Value must be at least {min_val}.")
+            return False
+        if max_val is not None and int_value > max_val:
+            print(f"Value must be no more than {max_val}.")
+            return False
+        return True
 
-    def is_valid_float(self, input_value, min_val=None, max_val=None):
+    @staticmethod
+    def is_valid_float(input_value, min_val=None, max_val=None):
         """
         Validates if a value is a floating-point number within the specified range.
 
@@ -73,20 +166,20 @@ class InputValidator:
         Returns:
         - bool: True if the value is a valid float and within range, False otherwise.
         """
-        try:
-            float_value = float(input_value)
-            if min_val is not None and float_value < min_val:
-                print(f"Value must be at least {min_val}.")
-                return False
-            if max_val is not None and float_value > max_val:
-                print(f"Value must be no more than {max_val}.")
-                return False
-            return True
-        except ValueError:
+        float_value = _parse_float(input_value)
+        if float_value is None:
             print("Invalid input. Please enter a floating-point number.")
             return False
+        if min_val is not None and float_value < min_val:
+            print(f"Value must be at least {min_val}.")
+            return False
+        if max_val is not None and float_value > max_val:
+            print(f"Value must be no more than {max_val}.")
+            return False
+        return True
 
-    def get_string_input(self, prompt="Enter a string: ", min_length=None, max_length=None):
+    @staticmethod
+    def get_string_input(prompt="Enter a string: ", min_length=None, max_length=None):
         """
         Prompts the user to enter a string that meets the specified length constraints.
 
@@ -100,10 +193,11 @@ class InputValidator:
         """
         while True:
             user_input = input(prompt)
-            if self.is_valid_string(user_input, min_length, max_length):
+            if InputValidator.is_valid_string(user_input, min_length, max_length):
                 return user_input
 
-    def get_int_input(self, prompt="Enter an integer: ", min_val=None, max_val=None):
+    @staticmethod
+    def get_int_input(prompt="Enter an integer: ", min_val=None, max_val=None):
         """
         Prompts the user to enter an integer within the specified range.
 
@@ -117,10 +211,11 @@ class InputValidator:
         """
         while True:
             user_input = input(prompt)
-            if self.is_valid_int(user_input, min_val, max_val):
+            if InputValidator.is_valid_int(user_input, min_val, max_val):
                 return int(user_input)
 
-    def get_float_input(self, prompt="Enter a float: ", min_val=None, max_val=None):
+    @staticmethod
+    def get_float_input(prompt="Enter a float: ", min_val=None, max_val=None):
         """
         Prompts the user to enter a float within the specified range.
 
@@ -134,36 +229,112 @@ class InputValidator:
         """
         while True:
             user_input = input(prompt)
-            if self.is_valid_float(user_input, min_val, max_val):
+            if InputValidator.is_valid_float(user_input, min_val, max_val):
                 return float(user_input)
 
-    def is_valid_email(self, email):
+    @staticmethod
+    def is_valid_email(email):
         """
         Validates if the given email address is in a proper format.
 
+        The address is checked with length tests and character-set lookups rather than a regular expression,
+        so validation is a single linear pass with no backtracking, even on adversarial input.
+
         Parameters:
         - email (str): The email address to validate.
 
         Returns:
         - bool: True if the email address is valid, False otherwise.
         """
-        email_pattern = r"^(?=.{1,64}@.{1,255}$)(?=.{6,256}$)[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"
-        return bool(re.match(email_pattern, email))
+        return _check_email(email)
 
-    def is_valid_phone(self, phone):
+    @staticmethod
+    def is_valid_phone(phone):
         """
         Validates if the given phone number is a valid Indian mobile number.
 
+        Placeholder numbers (a single repeated digit, or a sequential run such as 9876543210) are rejected.
+
         Parameters:
         - phone (str): The phone number to validate. Can optionally include the "+91" country code prefix.
 
         Returns:
         - bool: True if the phone number is valid, False otherwise.
         """
-        phone_pattern = r"^(\+91[-\s]?)?[6-9]\d{9}$"
-        return bool(re.match(phone_pattern, phone))
+        return _check_phone(phone)
+
+    @staticmethod
+    def validate_strings_bulk(values, min_length=None, max_length=None):
+        """
+        Validates many strings against length constraints at once, e.g. a column of a batch import.
+
+        Unlike is_valid_string, nothing is printed for invalid entries.
+
+        Parameters:
+        - values (iterable of str): The strings to validate.
+        - min_length (int, optional): Minimum allowable length of each string.
+        - max_length (int, optional): Maximum allowable length of each string.
+
+        Returns:
+        - list of bool: One entry per value, True where the value is valid.
+        """
+        low = 0 if min_length is None else min_length
+        if max_length is None:
+            return [len(value) >= low for value in values]
+        return [low <= len(value) <= max_length for value in values]
+
+    @staticmethod
+    def validate_ints_bulk(values, min_val=None, max_val=None):
+        """
+        Validates many integer inputs against a range at once, e.g. a column of a batch import.
+
+        Unlike is_valid_int, nothing is printed for invalid entries.
+
+        Parameters:
+        - values (iterable of str or int): The inputs to validate. Numbers are accepted as well as strings.
+        - min_val (int, optional): Minimum allowable value.
+        - max_val (int, optional): Maximum allowable value.
+
+        Returns:
+        - list of bool: One entry per value, True where the value is a valid integer within range.
+        """
+        mask = []
+        for int_value in map(_parse_int, values):
+            mask.append(
+                int_value is not None
+                and (min_val is None or int_value >= min_val)
+                and (max_val is None or int_value <= max_val)
+            )
+        return mask
+
+    @staticmethod
+    def validate_emails_bulk(emails):
+        """
+        Validates many email addresses at once, e.g. a column of a batch import.
+
+        Parameters:
+        - emails (iterable of str): The email addresses to validate.
+
+        Returns:
+        - list of bool: One entry per address, True where the address is valid.
+        """
+        return list(map(_check_email, emails))
+
+    @staticmethod
+    def validate_phones_bulk(phones):
+        """
+        Validates many phone numbers at once, e.g. a column of a batch import.
+
+        Parameters:
+        - phones (iterable of str): The phone numbers to validate.
+
+        Returns:
+        - list of bool: One entry per number, True where the number is valid.
+        """
+        return list(map(_check_phone, phones))
 
-    def is_valid_password(self, password, min_length=None, max_length=None):
+    @staticmethod
+    def is_valid_password(password, min_length=None, max_length=None):
         """
         Validates if the password meets specified length constraints.
 
@@ -175,13 +346,30 @@ class InputValidator:
         Returns:
         - bool: True if the password is valid, False otherwise.
         """
-        if min_length is not None and len(password) < min_length:
-            return False
-        if max_length is not None and len(password) > max_length:
-            return False
-        return True
+        return InputValidator.password_error(password, min_length, max_length) is None
+
+    @staticmethod
+    def password_error(password, min_length=None, max_length=None):
+        """
+        Checks the password's length constraints once and describes the first one it breaks.
 
-    def get_email_input(self, prompt="Enter an email address: "):
+        Parameters:
+        - password (str): The password to validate.
+        - min_length (int, optional): Minimum allowable length.
+        - max_length (int, optional): Maximum allowable length.
+
+        Returns:
+        - str: The error message to show the user, or None if the password is valid.
+        """
+        length = len(password)
+        if min_length is not None and length < min_length:
+            return f"Password must be at least {min_length} characters long."
+        if max_length is not None and length > max_length:
+            return f"Password must be no longer than {max_length} characters."
+        return None
+
+    @staticmethod
+    def get_email_input(prompt="Enter an email address: "):
         """
         Prompts the user to enter a valid email address.
 
@@ -193,12 +381,13 @@ class InputValidator:
         """
         while True:
             email = input(prompt)
-            if self.is_valid_email(email):
+            if InputValidator.is_valid_email(email):
                 return email
             else:
                 print("Invalid email format. Please enter a valid email address.")
 
-    def get_phone_input(self, prompt="Enter a phone number: "):
+    @staticmethod
+    def get_phone_input(prompt="Enter a phone number: "):
         """
         Prompts the user to enter a valid Indian phone number.
 
@@ -210,12 +399,14 @@ class InputValidator:
         """
         while True:
             phone = input(prompt)
-            if self.is_valid_phone(phone):
+            if InputValidator.is_valid_phone(phone):
                 return phone
             else:
-                print("Phone number must be 10 digits, optionally starting with '+91'. First digit must be 6-9.")
+                print("Phone number must be 10 digits, optionally starting with '+91'. First digit must be 6-9. "
+                      "Placeholder numbers are not accepted.")
 
-    def get_password_input(self, prompt="Enter a password: ", min_length=8, max_length=20):
+    @staticmethod
+    def get_password_input(prompt="Enter a password: ", min_length=8, max_length=20):
         """
         Prompts the user to enter a password that meets length constraints.
 
@@ -236,11 +427,11 @@ class InputValidator:
                 continue
             
             # Validate the password length
-            if not self.is_valid_password(password, min_length, max_length):
-                if min_length is not None and len(password) < min_length:
-                    print(f"Password must be at least {min_length} characters long.")
-                elif max_length is not None and len(password) > max_length:
-                    print(f"Password must be no longer than {max_length} characters.")
+            error = InputValidator.password_error(password, min_length, max_length)
+            if error is not None:
+                print(error)
             else:
-                password_handler = Password()
-                return password_handler.hash_password(password)
\ No newline at end of file
+                return PASSWORD_HANDLER.hash_password(password)
+
+# Shared instance; InputValidator keeps no state, so callers reuse it instead of constructing their own
+VALIDATOR = InputValidator()
@@ -1,11 +1,52 @@
 # password.py
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import bcrypt
 
+@lru_cache(maxsize=16)
+def _byte_shift_table(shift: int) -> bytes:
+    """
+    Returns a 256-entry bytes.translate table that adds shift to every byte value.
+    """
+    return bytes((code + shift) % 256 for code in range(256))
+
+# Tables for the default shift (encrypt/decrypt with shift=3), built at import so the common calls skip the cache
+_ENCRYPT_TABLE = _byte_shift_table(3)
+_DECRYPT_TABLE = _byte_shift_table(-3)
+
+def _shift_string(text: str, shift: int) -> str:
+    """
+    Shifts the code point of every character in text by shift.
+    Pure-ASCII text whose shifted code points stay within 0-255 is shifted with one bytes.translate call;
+    anything else goes through str.translate with a mapping built once per distinct character.
+    """
+    if text.isascii() and -128 <= shift <= 128:
+        encoded = text.encode('ascii')
+        # A negative shift must not take any character below code point 0
+        if shift >= 0 or not any(code in encoded for code in range(-shift)):
+            if shift == 3:
+                table = _ENCRYPT_TABLE
+            elif shift == -3:
+                table = _DECRYPT_TABLE
+            else:
+                table = _byte_shift_table(shift)
+            return encoded.translate(table).decode('latin-1')
+    return text.translate({code: code + shift for code in map(ord, set(text))})
+
 class Password:
     
-    def __init__(self):
-        pass
+    # The cost factor is the only per-instance state; slots avoid a per-instance __dict__
+    __slots__ = ("_rounds",)
+
+    def __init__(self, rounds: int = 12):
+        """
+        rounds is the bcrypt cost factor used by hash_password; hashing time doubles with each extra round.
+        The default of 12 suits interactive sign-up; bulk imports may pass a lower value such as 10.
+        """
+        self._rounds = rounds
 
     def hash_password(self, password: str) -> str:
         """
@@ -13,12 +54,21 @@ class Password:
         bcrypt automatically handles salting (adding random data to the password before hashing).
         """
         # Generate a salt
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self._rounds)
         # Hash the password with the salt
         hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
         # Return the hashed password as a string (in utf-8)
         return hashed_password.decode('utf-8')
     
+    def hash_passwords_bulk(self, passwords: list[str]) -> list[str]:
+        """
+        This method hashes many passwords (e.g. for a bulk user import) and returns the hashes in the same order.
+        bcrypt releases the GIL while hashing, so a thread pool spreads the work across all CPU cores.
+        """
+        if len(passwords) < 2:
+            return [self.hash_password(password) for password in passwords]
+        with ThreadPoolExecutor(max_workers=min(len(passwords), os.cpu_count() or 1)) as executor:
+            return list(executor.map(self.hash_password, passwords))
     
     def check_password(self, password: str, hashed_password: str) -> bool:
         """
@@ -31,12 +81,15 @@ class Password:
         """
         This method encrypts a string by shifting the ASCII value of each character.
         """
-        encrypted_string = ''.join([chr(ord(char) + shift) for char in input_string])
+        encrypted_string = _shift_string(input_string, shift)
         return encrypted_string
     
     def decrypt(self, encrypted_string: str, shift: int = 3) -> str:
         """
         This method decrypts the encrypted string by shifting the ASCII value back.
         """
-        decrypted_string = ''.join([chr(ord(char) - shift) for char in encrypted_string])
+        decrypted_string = _shift_string(encrypted_string, -shift)
         return decrypted_string
+
+# Shared instance with the default cost factor, reused by callers instead of constructing their own
+PASSWORD_HANDLER = Password()
@@ -1,9 +1,38 @@
 # ux_enhancements.py
+from functools import lru_cache
 from colorama import Fore, Style, init
-from art import text2art
 from .input_validator import InputValidator
 
-init(autoreset=True)
+@lru_cache(maxsize=None)
+def _init_colors():
+    """
+    Initializes colorama the first time the toolkit prints, instead of at import.
+    Programs that import this module without printing through it keep their stdout unwrapped.
+    """
+    init(autoreset=True)
+
+# Heading decoration per importance level: (character, count at size 1.0). Level 5 is a single '~' at any size.
+_HEADING_DECORATIONS = {1: ('=', 10), 2: ('*', 7), 3: ('-', 5), 4: ('~', 3)}
+
+@lru_cache(maxsize=64)
+def _heading_decoration(imp, size):
+    """Returns the decoration string for a heading of the given importance level and size."""
+    if imp == 5:
+        return '~'
+    char, count = _HEADING_DECORATIONS.get(imp, ('', 0))
+    return char * int(count * size)
+
+@lru_cache(maxsize=256)
+def _box_border(line_length, color):
+    """Returns the colored top/bottom border of a box line_length characters wide."""
+    return color + '+' + '-' * (line_length - 2) + '+' + Style.RESET_ALL
+
+@lru_cache(maxsize=128)
+def _ascii_art(text):
+    """Returns text2art(text), cached so redrawing the same banner skips the font rendering."""
+    # art loads large font tables, so it is imported on the first banner rather than with this module
+    from art import text2art
+    return text2art(text)
 
 class TerminalToolkit:
     # Central color mapping as a class attribute
@@ -41,10 +70,11 @@ class TerminalToolkit:
             text (str): The text to be boxed.
             color (str): Color of the box border.
         """
+        _init_colors()
         chosen_color = self.get_color(color)
         text = str(text)
         line_length = len(text) + 4
-        top_border = f"{chosen_color}{'+' + '-' * (line_length - 2) + '+'}{Style.RESET_ALL}"
+        top_border = _box_border(line_length, chosen_color)
         side_border = f"{chosen_color}| {text} |{Style.RESET_ALL}"
 
         print(top_border)
@@ -62,23 +92,13 @@ class TerminalToolkit:
             size (float): Multiplier for text size (affects the number of decorations).
             uppercase (bool): If True, converts text to uppercase; if None, uses uppercase for imp=1 by default.
         """
+        _init_colors()
         chosen_color = self.get_color(color)
         text = str(text)
         if uppercase or (uppercase is None and imp == 1):
             text = text.upper()
 
-        if imp == 1:
-            decoration = '=' * int(10 * size)
-        elif imp == 2:
-            decoration = '*' * int(7 * size)
-        elif imp == 3:
-            decoration = '-' * int(5 * size)
-        elif imp == 4:
-            decoration = '~' * int(3 * size)
-        elif imp == 5:
-            decoration = '~'
-        else:
-            decoration = ''
+        decoration = _heading_decoration(imp, size)
 
         formatted_text = f"{chosen_color}{decoration} {text} {decoration}{Style.RESET_ALL}"
         print(formatted_text)
@@ -91,8 +111,9 @@ class TerminalToolkit:
             text (str): The text to be enlarged.
             color (str): The color of the ASCII art text (e.g., 'cyan', 'yellow', etc.).
         """
+        _init_colors()
         chosen_color = self.get_color(color)
-        ascii_art = text2art(text)
+        ascii_art = _ascii_art(text)
         print(f"{chosen_color}{ascii_art}{Style.RESET_ALL}")
 
     def menu(self, question, *options):